@@ -155,8 +155,10 @@ following ``QuantumCircuit`` methods which are patched when importing Aer.
     save_density_matrix
     save_expectation_value
     save_expectation_value_variance
+    save_marginal_probabilities
     save_matrix_product_state
     save_probabilities
+    save_probabilities_batch
     save_probabilities_dict
     save_stabilizer
     save_state
@@ -18,7 +18,9 @@ from .save_expectation_value import (SaveExpectationValue,
                                      save_expectation_value_variance)
 from .save_probabilities import (SaveProbabilities, save_probabilities,
                                  SaveProbabilitiesDict,
-                                 save_probabilities_dict)
+                                 save_probabilities_dict,
+                                 save_probabilities_batch,
+                                 save_marginal_probabilities)
 from .save_statevector import (SaveStatevector, save_statevector,
                                SaveStatevectorDict, save_statevector_dict)
 from .save_density_matrix import SaveDensityMatrix, save_density_matrix
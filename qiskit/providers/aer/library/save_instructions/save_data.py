@@ -14,6 +14,7 @@ Simulator instruction to save custom internal data to results.
 """
 
 import copy
+import sys
 
 from qiskit.circuit import Instruction
 from qiskit.extensions.exceptions import ExtensionError
@@ -59,7 +60,8 @@ class SaveData(Instruction):
 
         super().__init__(name, num_qubits, 0, params)
 
-        self._label = label
+        # Intern labels so the many instructions sharing a label share one str
+        self._label = sys.intern(str(label))
         self._subtype = subtype
 
     def assemble(self):
@@ -13,10 +13,22 @@
 Simulator instruction to save measurement outcome probabilites.
 """
 
-from qiskit.circuit import QuantumCircuit
+import weakref
+
+import numpy as np
+
+from qiskit.circuit import QuantumCircuit, Qubit
+from qiskit.circuit.exceptions import CircuitError
+from qiskit.extensions.exceptions import ExtensionError
 from .save_data import SaveAverageData
 from ..default_qubits import default_qubits
 
+# Per circuit caches of the default qubits and qubit indices used by the
+# save methods. QuantumCircuit defines __eq__ and so is not hashable,
+# hence entries are keyed by id and dropped by a weakref callback when the
+# circuit is garbage collected.
+_CIRCUIT_CACHE = {}
+
 
 class SaveProbabilities(SaveAverageData):
     """Save measurement outcome probabilities vector."""
@@ -99,11 +111,34 @@ class SaveSpecificProbability(SaveAverageData):
         we compute the probability of the outcome 0 on qubit 0, 1 on qubit 1 and 0 on qubit 2
         if states = [0,1], qubits = [5,1]
         we compute the probability of the outcome 0 on qubit 5 and 1 on qubit 0
+
+        Raises:
+            ExtensionError: if the states and qubits have different lengths,
+                            the states are not 0 or 1, or the qubits are
+                            not unique non-negative integers.
         """
+        # Validate before casting to compact dtypes, which would wrap or
+        # truncate invalid values
+        qubits = np.asarray(qubits)
+        states = np.asarray(states)
+        if qubits.size != states.size:
+            raise ExtensionError(
+                "Number of states does not match the number of qubits.")
+        if qubits.size:
+            if states.dtype.kind not in 'biu' or ((states != 0) & (states != 1)).any():
+                raise ExtensionError("Invalid states, states must be 0 or 1.")
+            if (qubits.dtype.kind not in 'iu' or (qubits < 0).any()
+                    or (qubits > np.iinfo(np.int32).max).any()):
+                raise ExtensionError(
+                    "Invalid qubits, qubits must be non-negative integers.")
+            if np.unique(qubits).size != qubits.size:
+                raise ExtensionError("Invalid qubits, qubits must be unique.")
+        qubits = qubits.astype(np.int32)
+        states = states.astype(np.uint8)
         super().__init__("save_specific_prob", num_qubits, label,
                          pershot=pershot,
                          conditional=conditional,
-                         params=[qubits, states])
+                         params=[qubits.tolist(), states.tolist()])
 
 
 def save_probabilities(self,
@@ -128,10 +163,10 @@ def save_probabilities(self,
                             [Default: False].
 
     Returns:
-        QuantumCircuit: with attached instruction.
+        InstructionSet: with attached instruction.
     """
-    qubits = default_qubits(self, qubits=qubits)
-    instr = SaveProbabilities(len(qubits),
+    qubits, num_qubits = _resolve(self, qubits)
+    instr = SaveProbabilities(num_qubits,
                               label=label,
                               unnormalized=unnormalized,
                               pershot=pershot,
@@ -161,10 +196,10 @@ def save_probabilities_dict(self,
                             [Default: False].
 
     Returns:
-        QuantumCircuit: with attached instruction.
+        InstructionSet: with attached instruction.
     """
-    qubits = default_qubits(self, qubits=qubits)
-    instr = SaveProbabilitiesDict(len(qubits),
+    qubits, num_qubits = _resolve(self, qubits)
+    instr = SaveProbabilitiesDict(num_qubits,
                                   label=label,
                                   unnormalized=unnormalized,
                                   pershot=pershot,
@@ -172,6 +207,99 @@ def save_probabilities_dict(self,
     return self.append(instr, qubits)
 
 
+def save_marginal_probabilities(self,
+                                groups,
+                                label="marginal_probabilities",
+                                unnormalized=False,
+                                pershot=False,
+                                conditional=False):
+    """Save marginal measurement outcome probabilities for groups of qubits.
+
+    A separate probabilities vector is saved for each group of qubits with
+    the key ``f"{label}_{i}"`` for the i-th group. The simulator only
+    computes the ``2 ** len(group)`` marginal of each group rather than the
+    full joint distribution over all qubits in the groups.
+
+    Args:
+        groups (list[list]): the groups of qubits to save marginal
+                             probabilities for.
+        label (str): the key prefix for retrieving saved data from results.
+        unnormalized (bool): If True return save the unnormalized accumulated
+                             probabilities over all shots [Default: False].
+        pershot (bool): if True save a list of probabilities for each shot
+                        of the simulation rather than the average over
+                        all shots [Default: False].
+        conditional (bool): if True save the probabilities data conditional
+                            on the current classical register values
+                            [Default: False].
+
+    Returns:
+        QuantumCircuit: with attached instructions.
+    """
+    labels = [f"{label}_{i}" for i in range(len(groups))]
+    return save_probabilities_batch(self, groups, labels,
+                                    unnormalized=unnormalized,
+                                    pershot=pershot,
+                                    conditional=conditional)
+
+
+def save_probabilities_batch(self,
+                             qubit_groups,
+                             labels,
+                             unnormalized=False,
+                             pershot=False,
+                             conditional=False):
+    """Save measurement outcome probabilities vectors for several qubit groups.
+
+    This saves the same data as calling :func:`save_probabilities` for
+    each group and label, but skips the argument broadcasting of
+    ``QuantumCircuit.append`` for each instruction. Registers in a group
+    are expanded into their qubits. When called inside a control flow
+    builder block, such as ``with circuit.if_test(...)``, the instructions
+    are added to that block.
+
+    Args:
+        qubit_groups (list[list]): the qubits to save probabilities for
+                                   in each instruction.
+        labels (list[str]): the key for retrieving saved data from results
+                            for each instruction.
+        unnormalized (bool): If True return save the unnormalized accumulated
+                             probabilities over all shots [Default: False].
+        pershot (bool): if True save a list of probabilities for each shot
+                        of the simulation rather than the average over
+                        all shots [Default: False].
+        conditional (bool): if True save the probabilities data conditional
+                            on the current classical register values
+                            [Default: False].
+
+    Returns:
+        QuantumCircuit: with attached instructions.
+
+    Raises:
+        ExtensionError: if the number of labels and qubit groups differ.
+        CircuitError: if a qubit group contains duplicate qubits.
+    """
+    if len(labels) != len(qubit_groups):
+        raise ExtensionError(
+            "Number of labels does not match the number of qubit groups.")
+    # Append to the innermost control flow builder block if one is active,
+    # the same as QuantumCircuit.append
+    if self._control_flow_scopes:
+        appender = self._control_flow_scopes[-1].append
+    else:
+        appender = self._append
+    for qubits, label in zip(qubit_groups, labels):
+        qargs = self.qbit_argument_conversion(_resolve(self, qubits)[0])
+        self._check_dups(qargs)
+        instr = SaveProbabilities(len(qargs),
+                                  label=label,
+                                  unnormalized=unnormalized,
+                                  pershot=pershot,
+                                  conditional=conditional)
+        appender(instr, qargs, [])
+    return self
+
+
 def save_specific_probability(self, states, qubits, label="specific_probability",
                               pershot=False,
                               conditional=False):
@@ -179,7 +307,9 @@ def save_specific_probability(self, states, qubits, label="specific_probability"
 
     Args:
         states (list): list of ints indicating the outcome to compute the probability for
-        qubits (list): list of ints indicating which qubits the measurement is on
+        qubits (list or QuantumRegister or None): the qubits the measurement is on,
+                                                 as ints or Qubits. If None all
+                                                 qubits are measured.
         label (str): the key for retrieving saved data from results.
         pershot (bool): if True save a list of probabilities for each shot
                         of the simulation rather than the average over
@@ -194,16 +324,92 @@ def save_specific_probability(self, states, qubits, label="specific_probability"
         we compute the probability of 0 on qubit 5 and 1 on qubit 0
 
     Returns:
-        QuantumCircuit: with attached instruction.
+        InstructionSet: with attached instruction.
     """
-    if qubits is None:
-        qubits = default_qubits(self)
-    instr = SaveSpecificProbability(len(qubits), states, qubits, label=label,
+    qubits, num_qubits = _resolve(self, qubits)
+    measured = _qubit_indices(self, qubits)
+    instr = SaveSpecificProbability(num_qubits, states, measured, label=label,
                                     pershot=pershot,
                                     conditional=conditional)
     return self.append(instr, qubits)
 
 
+def _resolve(circuit, qubits):
+    """Return the qubits for a save instruction and the number of qubits.
+
+    Args:
+        circuit (QuantumCircuit): the circuit the instruction is added to.
+        qubits (list or QuantumRegister or None): the qubits argument. If
+            None the cached default qubits of the circuit are used.
+
+    Returns:
+        tuple: the pair ``(qubits, num_qubits)``.
+    """
+    if qubits is None:
+        qubits = _cached_default_qubits(circuit)
+    else:
+        qubits = default_qubits(circuit, qubits)
+    return qubits, len(qubits)
+
+
+def _circuit_cache(circuit):
+    """Return the cache dict for a circuit, creating it if needed."""
+    key = id(circuit)
+    cache = _CIRCUIT_CACHE.get(key)
+    if cache is None or cache['ref']() is not circuit:
+        ref = weakref.ref(circuit, lambda _: _CIRCUIT_CACHE.pop(key, None))
+        cache = _CIRCUIT_CACHE[key] = {'ref': ref}
+    return cache
+
+
+def _cached_default_qubits(circuit):
+    """Return the default qubits of a circuit as a tuple.
+
+    The result is cached per circuit and recomputed if the number of
+    qubits or registers in the circuit has changed since it was cached.
+    Registers can only be added to a circuit, so this detects any change
+    to the registers the default qubits are built from.
+    """
+    cache = _circuit_cache(circuit)
+    fingerprint = (circuit.num_qubits, len(circuit.qregs))
+    entry = cache.get('default_qubits')
+    if entry is None or entry[0] != fingerprint:
+        entry = cache['default_qubits'] = (fingerprint, tuple(default_qubits(circuit)))
+    return entry[1]
+
+
+def _qubit_indices(circuit, qubits):
+    """Return the circuit indices of a list of qubits.
+
+    Qubit objects are replaced by their circuit index and any other values,
+    such as int indices, are returned unchanged. The bit to index map is
+    only built when first needed and is cached per circuit until the
+    number of qubits in the circuit changes. Bits are only ever appended to
+    a circuit so existing indices never change.
+
+    Raises:
+        CircuitError: if a qubit is not in the circuit.
+    """
+    if not any(isinstance(bit, Qubit) for bit in qubits):
+        return list(qubits)
+    cache = _circuit_cache(circuit)
+    entry = cache.get('bit_indices')
+    if entry is None or entry[0] != circuit.num_qubits:
+        bit_indices = {bit: index for index, bit in enumerate(circuit.qubits)}
+        entry = cache['bit_indices'] = (circuit.num_qubits, bit_indices)
+    bit_indices = entry[1]
+    indices = []
+    for bit in qubits:
+        if isinstance(bit, Qubit):
+            if bit not in bit_indices:
+                raise CircuitError(f"Qubit {bit} is not in the circuit.")
+            bit = bit_indices[bit]
+        indices.append(bit)
+    return indices
+
+
 QuantumCircuit.save_probabilities = save_probabilities
 QuantumCircuit.save_probabilities_dict = save_probabilities_dict
+QuantumCircuit.save_probabilities_batch = save_probabilities_batch
+QuantumCircuit.save_marginal_probabilities = save_marginal_probabilities
 QuantumCircuit.save_specific_probability = save_specific_probability
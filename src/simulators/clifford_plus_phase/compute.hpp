@@ -72,7 +72,7 @@ private:
   double compute_algorithm_all_phases_T(AGState &state);
   double compute_algorithm_arbitrary_phases(AGState &state);
   size_t num_code_qubits; //our AG state has code+magic qubits
-  double compute_probability(std::vector<uint_t> measured_qubits, std::vector<uint_t> outcomes);
+  double compute_probability(const std::vector<uint_t> &measured_qubits, const std::vector<uint_t> &outcomes);
   template <typename InputIterator>
   uint_t count_magic_gates(InputIterator first, InputIterator last) const;
 };
@@ -417,7 +417,7 @@ double State::compute_algorithm_arbitrary_phases(AGState &state){
 }
 
 
-double State::compute_probability(std::vector<uint_t> measured_qubits, std::vector<uint_t> outcomes){
+double State::compute_probability(const std::vector<uint_t> &measured_qubits, const std::vector<uint_t> &outcomes){
   AGState copied_ag(this->qreg_); //copy constructor TODO check this
 
   //first reorder things so the first w qubits are measured
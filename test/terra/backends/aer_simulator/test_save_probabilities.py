@@ -73,6 +73,63 @@ class TestSaveProbabilities(SimulatorTestCase):
         value = Counts(result.data(0)[label], memory_slots=len(qubits))
         self.assertDictAlmostEqual(value, target)
 
+    @supported_methods([
+        'automatic', 'statevector', 'density_matrix', 'matrix_product_state',
+        'stabilizer'
+    ])
+    def test_save_marginal_probabilities(self, method, device):
+        """Test save marginal probabilities"""
+        backend = self.backend(method=method, device=device)
+
+        circ = QuantumCircuit(3)
+        circ.x(0)
+        circ.h(1)
+        circ.cx(1, 2)
+
+        # Target probabilities
+        groups = [[0], [2, 1]]
+        state = qi.Statevector(circ)
+        targets = [state.probabilities(qubits) for qubits in groups]
+
+        label = 'probs'
+        circ.save_marginal_probabilities(groups, label=label)
+        result = backend.run(transpile(circ, backend, optimization_level=0),
+                             shots=1).result()
+        self.assertTrue(result.success)
+        simdata = result.data(0)
+        for i, target in enumerate(targets):
+            key = f'{label}_{i}'
+            self.assertIn(key, simdata)
+            self.assertTrue(np.allclose(simdata[key], target))
+
+    @supported_methods([
+        'automatic', 'statevector', 'density_matrix', 'matrix_product_state',
+        'stabilizer'
+    ])
+    def test_save_probabilities_batch(self, method, device):
+        """Test save probabilities batch"""
+        backend = self.backend(method=method, device=device)
+
+        circ = QuantumCircuit(3)
+        circ.x(0)
+        circ.h(1)
+        circ.cx(1, 2)
+
+        # Target probabilities
+        groups = [[0, 1], [1, 0], [2]]
+        labels = ['probs0', 'probs1', 'probs2']
+        state = qi.Statevector(circ)
+        targets = [state.probabilities(qubits) for qubits in groups]
+
+        circ.save_probabilities_batch(groups, labels)
+        result = backend.run(transpile(circ, backend, optimization_level=0),
+                             shots=1).result()
+        self.assertTrue(result.success)
+        simdata = result.data(0)
+        for label, target in zip(labels, targets):
+            self.assertIn(label, simdata)
+            self.assertTrue(np.allclose(simdata[label], target))
+
     @supported_methods([
         'automatic', 'statevector', 'density_matrix', 'matrix_product_state',
         'stabilizer'
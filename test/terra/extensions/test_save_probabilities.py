@@ -0,0 +1,209 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2018, 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+import unittest
+
+from qiskit import QuantumCircuit, QuantumRegister
+from qiskit.circuit import Qubit
+from qiskit.circuit.exceptions import CircuitError
+from qiskit.extensions.exceptions import ExtensionError
+from qiskit.providers.aer.library.save_instructions.save_probabilities import (
+    SaveProbabilities, SaveSpecificProbability)
+
+from ..common import QiskitAerTestCase
+
+
+class TestSaveProbabilities(QiskitAerTestCase):
+    """SaveProbabilities instruction tests"""
+
+    def test_default_qubits(self):
+        """Test default qubits are all circuit qubits"""
+        circ = QuantumCircuit(3)
+        circ.save_probabilities()
+        instr, qargs, _ = circ.data[-1]
+        self.assertIsInstance(instr, SaveProbabilities)
+        self.assertEqual(instr.num_qubits, 3)
+        self.assertEqual(list(qargs), circ.qubits)
+
+    def test_default_qubits_add_register(self):
+        """Test default qubits are updated after adding a register"""
+        circ = QuantumCircuit(2)
+        circ.save_probabilities(label='probs0')
+        circ.add_register(QuantumRegister(1, 'r'))
+        circ.save_probabilities(label='probs1')
+        instr, qargs, _ = circ.data[-1]
+        self.assertEqual(instr.num_qubits, 3)
+        self.assertEqual(list(qargs), circ.qubits)
+
+    def test_default_qubits_register_of_existing_bits(self):
+        """Test default qubits are updated after registering loose bits"""
+        qubit = Qubit()
+        circ = QuantumCircuit(QuantumRegister(2, 'q'))
+        circ.add_bits([qubit])
+        circ.save_probabilities(label='probs0')
+        instr, qargs, _ = circ.data[-1]
+        self.assertEqual(instr.num_qubits, 2)
+        self.assertEqual(list(qargs), circ.qubits[:2])
+        circ.add_register(QuantumRegister(bits=[qubit], name='r'))
+        circ.save_probabilities(label='probs1')
+        instr, qargs, _ = circ.data[-1]
+        self.assertEqual(instr.num_qubits, 3)
+        self.assertEqual(list(qargs), circ.qubits)
+
+    def test_batch(self):
+        """Test save probabilities batch appends an instruction per group"""
+        circ = QuantumCircuit(3)
+        circ.save_probabilities_batch([[0, 1], [2]], ['probs0', 'probs1'])
+        self.assertEqual(len(circ.data), 2)
+        for (instr, qargs, _), qubits, label in zip(
+                circ.data, [[0, 1], [2]], ['probs0', 'probs1']):
+            self.assertIsInstance(instr, SaveProbabilities)
+            self.assertEqual(instr._label, label)
+            self.assertEqual(list(qargs), [circ.qubits[i] for i in qubits])
+
+    def test_batch_invalid_labels_raises(self):
+        """Test save probabilities batch with mismatched labels raises"""
+        circ = QuantumCircuit(2)
+        self.assertRaises(ExtensionError,
+                          lambda: circ.save_probabilities_batch([[0], [1]], ['probs']))
+
+    def test_batch_duplicate_qubits_raises(self):
+        """Test save probabilities batch with duplicate qubits raises"""
+        circ = QuantumCircuit(2)
+        self.assertRaises(CircuitError,
+                          lambda: circ.save_probabilities_batch([[0, 0]], ['probs']))
+
+    def test_batch_register_group(self):
+        """Test save probabilities batch expands registers in a group"""
+        qreg = QuantumRegister(3, 'q')
+        circ = QuantumCircuit(qreg)
+        circ.save_probabilities_batch([[qreg]], ['probs'])
+        instr, qargs, _ = circ.data[-1]
+        self.assertEqual(instr.num_qubits, 3)
+        self.assertEqual(list(qargs), list(qreg))
+
+    def test_batch_if_test(self):
+        """Test save probabilities batch inside an if_test block"""
+        circ = QuantumCircuit(2, 1)
+        with circ.if_test((circ.clbits[0], 1)):
+            circ.save_probabilities_batch([[0], [1]], ['probs0', 'probs1'])
+        self.assertEqual(len(circ.data), 1)
+        instr = circ.data[0][0]
+        self.assertEqual(instr.name, 'if_else')
+        body = instr.params[0]
+        self.assertEqual(len(body.data), 2)
+        for (inner, _, _), label in zip(body.data, ['probs0', 'probs1']):
+            self.assertIsInstance(inner, SaveProbabilities)
+            self.assertEqual(inner._label, label)
+
+    def test_marginal_if_test(self):
+        """Test save marginal probabilities inside an if_test block"""
+        circ = QuantumCircuit(3, 1)
+        with circ.if_test((circ.clbits[0], 1)):
+            circ.save_marginal_probabilities([[0], [2, 1]], label='probs')
+        self.assertEqual(len(circ.data), 1)
+        instr = circ.data[0][0]
+        self.assertEqual(instr.name, 'if_else')
+        body = instr.params[0]
+        self.assertEqual(len(body.data), 2)
+        for (inner, _, _), label, num_qubits in zip(
+                body.data, ['probs_0', 'probs_1'], [1, 2]):
+            self.assertIsInstance(inner, SaveProbabilities)
+            self.assertEqual(inner._label, label)
+            self.assertEqual(inner.num_qubits, num_qubits)
+
+
+class TestSaveSpecificProbability(QiskitAerTestCase):
+    """SaveSpecificProbability instruction tests"""
+
+    def test_default_kwarg(self):
+        """Test default kwargs"""
+        instr = SaveSpecificProbability(2, [0, 1], [5, 1])
+        self.assertEqual(instr.name, 'save_specific_prob')
+        self.assertEqual(instr._label, 'specific-probabilities')
+        self.assertEqual(instr._subtype, 'average')
+        self.assertEqual(instr.params, [[5, 1], [0, 1]])
+
+    def test_mismatched_length_raises(self):
+        """Test different numbers of states and qubits raises"""
+        self.assertRaises(ExtensionError,
+                          lambda: SaveSpecificProbability(2, [0, 1], [0]))
+
+    def test_invalid_state_raises(self):
+        """Test states other than 0 or 1 raises"""
+        self.assertRaises(ExtensionError,
+                          lambda: SaveSpecificProbability(2, [0, 2], [0, 1]))
+
+    def test_wrapping_state_raises(self):
+        """Test a state that wraps to 0 as uint8 raises"""
+        self.assertRaises(ExtensionError,
+                          lambda: SaveSpecificProbability(1, [256], [0]))
+
+    def test_negative_state_raises(self):
+        """Test a negative state raises"""
+        self.assertRaises(ExtensionError,
+                          lambda: SaveSpecificProbability(1, [-1], [0]))
+
+    def test_non_integer_state_raises(self):
+        """Test a non-integer state raises"""
+        self.assertRaises(ExtensionError,
+                          lambda: SaveSpecificProbability(1, [0.5], [0]))
+
+    def test_negative_qubit_raises(self):
+        """Test a negative qubit raises"""
+        self.assertRaises(ExtensionError,
+                          lambda: SaveSpecificProbability(1, [0], [-1]))
+
+    def test_duplicate_qubits_raises(self):
+        """Test duplicate qubits raises"""
+        self.assertRaises(ExtensionError,
+                          lambda: SaveSpecificProbability(2, [0, 1], [1, 1]))
+
+    def test_default_qubits(self):
+        """Test default qubits are saved as circuit indices"""
+        circ = QuantumCircuit(2)
+        circ.save_specific_probability([1, 0], None)
+        instr, qargs, _ = circ.data[-1]
+        self.assertEqual(instr.params, [[0, 1], [1, 0]])
+        self.assertEqual(list(qargs), circ.qubits)
+
+    def test_default_qubits_loose_bits(self):
+        """Test default qubits indices skip bits outside registers"""
+        circ = QuantumCircuit()
+        circ.add_bits([Qubit()])
+        circ.add_register(QuantumRegister(2, 'q'))
+        circ.save_specific_probability([1, 0], None)
+        instr, qargs, _ = circ.data[-1]
+        self.assertEqual(instr.params, [[1, 2], [1, 0]])
+        self.assertEqual(list(qargs), circ.qubits[1:])
+
+
+    def test_register_qubits(self):
+        """Test register qubits are saved as circuit indices"""
+        qreg = QuantumRegister(2, 'q')
+        circ = QuantumCircuit(QuantumRegister(1, 'a'), qreg)
+        circ.save_specific_probability([0, 1], qreg)
+        instr, qargs, _ = circ.data[-1]
+        self.assertEqual(instr.params, [[1, 2], [0, 1]])
+        self.assertEqual(list(qargs), list(qreg))
+
+    def test_qubit_objects(self):
+        """Test Qubit objects are saved as circuit indices"""
+        circ = QuantumCircuit(3)
+        circ.save_specific_probability([1, 0], [circ.qubits[2], circ.qubits[0]])
+        instr, qargs, _ = circ.data[-1]
+        self.assertEqual(instr.params, [[2, 0], [1, 0]])
+        self.assertEqual(list(qargs), [circ.qubits[2], circ.qubits[0]])
+
+
+if __name__ == '__main__':
+    unittest.main()